@@ -1,8 +1,12 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.models.chat import AvailabilityCreate, AvailabilityResponse, AvailabilityUpdate
+from app.models.chat import (
+    AvailabilityCreate, AvailabilityResponse, AvailabilityUpdate,
+    AvailabilityListAdapter,
+)
+from app.models.utils import dump_list_json
 from app.api import deps
 from app.db.database import get_db
 from app.db.db_models import User, Availability
@@ -45,7 +49,10 @@ async def read_my_availability(
         .where(Availability.professional_id == current_user.id)
         .order_by(Availability.date, Availability.start_time)
     )
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(AvailabilityListAdapter, AvailabilityResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.get("/{pro_id}", response_model=List[AvailabilityResponse])
@@ -62,7 +69,10 @@ async def read_professional_availability(
         )
         .order_by(Availability.date, Availability.start_time)
     )
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(AvailabilityListAdapter, AvailabilityResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.put("/{slot_id}", response_model=AvailabilityResponse)
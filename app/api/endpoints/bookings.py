@@ -38,7 +38,7 @@ async def read_bookings(
             select(ServiceRequest).where(ServiceRequest.id == b.request_id)
         )
         req = req_result.scalar_one_or_none()
-        legacy.append(LegacyBookingResponse(
+        legacy.append(LegacyBookingResponse.model_construct(
             id=b.id,
             user_id=b.customer_id,
             pro_id=b.professional_id,
@@ -117,7 +117,7 @@ async def read_pending_bookings(
 
     legacy = []
     for req in requests:
-        legacy.append(LegacyBookingResponse(
+        legacy.append(LegacyBookingResponse.model_construct(
             id=req.id,
             user_id=req.customer_id,
             pro_id=None,
@@ -1,12 +1,13 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_
 from app.models.chat import (
     ChatRoomCreate, ChatRoomResponse,
-    MessageCreate, MessageResponse,
+    MessageCreate, MessageResponse, MessageListAdapter,
 )
 from app.models.booking import BookingResponse
+from app.models.utils import from_orm_fast, dump_list_json
 from app.api import deps
 from app.db.database import get_db
 from app.db.db_models import (
@@ -126,13 +127,9 @@ async def list_chat_rooms(
         cust_result = await db.execute(select(User).where(User.id == room.customer_id))
         cust = cust_result.scalar_one_or_none()
 
-        responses.append(ChatRoomResponse(
-            id=room.id,
-            request_id=room.request_id,
-            customer_id=room.customer_id,
-            professional_id=room.professional_id,
-            status=room.status,
-            created_at=room.created_at,
+        responses.append(from_orm_fast(
+            ChatRoomResponse,
+            room,
             last_message=last_msg.content if last_msg else None,
             professional_name=pro.full_name if pro else None,
             customer_name=cust.full_name if cust else None,
@@ -163,7 +160,10 @@ async def get_messages(
         .where(Message.chat_room_id == room_id)
         .order_by(Message.created_at.asc())
     )
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(MessageListAdapter, MessageResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.post("/rooms/{room_id}/messages", response_model=MessageResponse)
@@ -1,11 +1,15 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
 from app.api import deps
 from app.db.database import get_db
 from app.db.db_models import User, ServiceRequest, Booking
-from app.models.booking import ServiceRequestResponse, BookingResponse
+from app.models.booking import (
+    ServiceRequestResponse, BookingResponse,
+    ServiceRequestListAdapter, BookingListAdapter,
+)
+from app.models.utils import dump_list_json
 from app.models.user import UserResponse
 from pydantic import BaseModel
 
@@ -85,7 +89,10 @@ async def get_my_requests(
         .where(ServiceRequest.customer_id == current_user.id)
         .order_by(ServiceRequest.created_at.desc())
     )
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(ServiceRequestListAdapter, ServiceRequestResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 @router.get("/bookings", response_model=List[BookingResponse])
 async def get_my_bookings(
@@ -98,7 +105,10 @@ async def get_my_bookings(
         .where(Booking.customer_id == current_user.id)
         .order_by(Booking.created_at.desc())
     )
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(BookingListAdapter, BookingResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 @router.get("/profile", response_model=UserResponse)
 async def get_profile(
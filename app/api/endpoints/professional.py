@@ -1,12 +1,16 @@
 from typing import Any, List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
 from app.api import deps
 from app.db.database import get_db
 from app.db.db_models import User, ServiceRequest, Booking, Availability, Review
-from app.models.booking import ServiceRequestResponse, BookingResponse
+from app.models.booking import (
+    ServiceRequestResponse, BookingResponse,
+    ServiceRequestListAdapter, BookingListAdapter,
+)
+from app.models.utils import dump_list_json
 from app.models.user import ProProfile
 from pydantic import BaseModel
 
@@ -24,12 +28,6 @@ class LocationUpdate(BaseModel):
     latitude: float
     longitude: float
 
-class AvailabilityUpdate(BaseModel):
-    date: str  # YYYY-MM-DD
-    start_time: str # HH:MM
-    end_time: str   # HH:MM
-    is_available: bool
-
 @router.get("/dashboard", response_model=ProDashboardStats)
 async def get_dashboard_stats(
     current_user: User = Depends(deps.get_current_professional),
@@ -114,7 +112,10 @@ async def get_available_requests(
         )
         .order_by(ServiceRequest.created_at.desc())
     )
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(ServiceRequestListAdapter, ServiceRequestResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 @router.get("/bookings", response_model=List[BookingResponse])
 async def get_my_bookings(
@@ -127,7 +128,10 @@ async def get_my_bookings(
         .where(Booking.professional_id == current_user.id)
         .order_by(Booking.created_at.desc())
     )
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(BookingListAdapter, BookingResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 @router.put("/location")
 async def update_location(
@@ -1,10 +1,14 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from pydantic import BaseModel
-from app.models.booking import ServiceRequestCreate, ServiceRequestResponse, ServiceRequestUpdate
+from app.models.booking import (
+    ServiceRequestCreate, ServiceRequestResponse, ServiceRequestUpdate,
+    ServiceRequestListAdapter,
+)
 from app.models.user import ProProfile
+from app.models.utils import from_orm_fast, dump_list_json
 from app.api import deps
 from app.db.database import get_db
 from app.db.db_models import User, ServiceRequest, Availability, Review, Booking
@@ -22,7 +26,7 @@ class DescriptionValidation(BaseModel):
 @router.post("/validate-description")
 async def validate_description(data: DescriptionValidation) -> Any:
     """Validate whether a service description is relevant to the category."""
-    return validate_service_description(data.category_id, data.description)
+    return await validate_service_description(data.category_id, data.description)
 
 
 @router.post("/", response_model=ServiceRequestResponse)
@@ -62,7 +66,10 @@ async def read_my_requests(
         .where(ServiceRequest.customer_id == current_user.id)
         .order_by(ServiceRequest.created_at.desc())
     )
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(ServiceRequestListAdapter, ServiceRequestResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.get("/open", response_model=List[ServiceRequestResponse])
@@ -77,7 +84,10 @@ async def read_open_requests(
         query = query.where(ServiceRequest.category_id == category)
     query = query.order_by(ServiceRequest.created_at.desc())
     result = await db.execute(query)
-    return result.scalars().all()
+    return Response(
+        content=dump_list_json(ServiceRequestListAdapter, ServiceRequestResponse, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.get("/{request_id}", response_model=ServiceRequestResponse)
@@ -223,17 +233,9 @@ async def get_matched_professionals(
         if not reasons:
             reasons.append("Category match")
 
-        profiles.append(ProProfile(
-            id=pro.id,
-            email=pro.email,
-            full_name=pro.full_name,
-            phone=pro.phone,
-            role=pro.role,
-            service_category=pro.service_category,
-            bio=pro.bio,
-            address=pro.address,
-            is_active=pro.is_active,
-            created_at=pro.created_at,
+        profiles.append(from_orm_fast(
+            ProProfile,
+            pro,
             rating=round(avg_rating, 1),
             jobs_completed=jobs_completed,
             reviews_count=reviews_count,
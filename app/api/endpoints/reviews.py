@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.chat import ReviewCreate, ReviewResponse
+from app.models.utils import from_orm_fast
 from app.api import deps
 from app.db.database import get_db
 from app.db.db_models import User, Review, Booking
@@ -88,14 +89,9 @@ async def get_user_reviews(
         # Get reviewer name
         reviewer_result = await db.execute(select(User).where(User.id == review.reviewer_id))
         reviewer = reviewer_result.scalar_one_or_none()
-        responses.append(ReviewResponse(
-            id=review.id,
-            booking_id=review.booking_id,
-            reviewer_id=review.reviewer_id,
-            reviewee_id=review.reviewee_id,
-            rating=review.rating,
-            comment=review.comment,
-            created_at=review.created_at,
+        responses.append(from_orm_fast(
+            ReviewResponse,
+            review,
             reviewer_name=reviewer.full_name if reviewer else None,
         ))
     return responses
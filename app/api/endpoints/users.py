@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from app.models.user import UserResponse, UserUpdate, ProProfile
+from app.models.utils import from_orm_fast
 from app.api import deps
 from app.db.database import get_db
 from app.db.db_models import User, Review, Booking
@@ -60,17 +61,9 @@ async def read_user_profile(
     )
     jobs_completed = jobs_result.scalar() or 0
 
-    return ProProfile(
-        id=user.id,
-        email=user.email,
-        full_name=user.full_name,
-        phone=user.phone,
-        role=user.role,
-        service_category=user.service_category,
-        bio=user.bio,
-        address=user.address,
-        is_active=user.is_active,
-        created_at=user.created_at,
+    return from_orm_fast(
+        ProProfile,
+        user,
         rating=round(avg_rating, 1),
         jobs_completed=jobs_completed,
         reviews_count=reviews_count,
@@ -27,6 +27,8 @@ class Settings(BaseSettings):
 
     # Gemini AI
     GEMINI_API_KEY: str = ""
+    # Paraphrase cache for Gemini results; needs requirements-semantic.txt
+    SEMANTIC_CACHE_ENABLED: bool = False
 
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = [
@@ -1,9 +1,10 @@
 """Seed the database with initial data."""
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from app.db.db_models import ServiceCategory, User, UserRole, Availability
+from app.db.database import AsyncSessionLocal
 from app.core.security import get_password_hash
-import random
 from datetime import datetime, timedelta
 
 CATEGORIES = [
@@ -81,71 +82,87 @@ CUSTOMERS = [
     }
 ]
 
+async def _seed_categories() -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(ServiceCategory), CATEGORIES)
+        await session.commit()
+    print(f"Seeded {len(CATEGORIES)} service categories.")
+
+
+async def _seed_professionals(new_pros: list, password_hash: str) -> None:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            insert(User).returning(User.id, User.email),
+            [
+                {**pro_data, "password_hash": password_hash, "role": UserRole.PRO.value, "is_active": True}
+                for pro_data in new_pros
+            ],
+        )
+        id_by_email = {row.email: row.id for row in result}
+
+        # Add availability for next 7 days (9 AM - 6 PM)
+        today = datetime.now()
+        days = [(today + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+        await session.execute(
+            insert(Availability),
+            [
+                {
+                    "professional_id": id_by_email[pro_data["email"]],
+                    "date": day,
+                    "start_time": "09:00",
+                    "end_time": "18:00",
+                    "is_recurring": False,
+                }
+                for pro_data in new_pros
+                for day in days
+            ],
+        )
+        await session.commit()
+    for pro_data in new_pros:
+        print(f"Seeded professional: {pro_data['full_name']}")
+
+
+async def _seed_customers(new_customers: list, password_hash: str) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            insert(User),
+            [
+                {**cust_data, "password_hash": password_hash, "role": UserRole.CUSTOMER.value, "is_active": True}
+                for cust_data in new_customers
+            ],
+        )
+        await session.commit()
+    for cust_data in new_customers:
+        print(f"Seeded customer: {cust_data['full_name']}")
+
+
 async def seed_data(db: AsyncSession):
-    """Seed the database with initial data."""
+    """Seed the database with initial data.
+
+    ``db`` is only used for the existence checks; the three insert batches are
+    independent and each runs on its own pooled connection concurrently.
+    """
     print("Starting database seed...")
-    
-    # 1. Seed Categories
-    result = await db.execute(select(ServiceCategory))
-    if not result.scalars().first():
-        for cat_data in CATEGORIES:
-            category = ServiceCategory(**cat_data)
-            db.add(category)
-        print(f"Seeded {len(CATEGORIES)} service categories.")
-    
-    # 2. Seed Professionals
-    password_hash = get_password_hash("password123")
-    
-    for pro_data in PROFESSIONALS:
-        result = await db.execute(select(User).where(User.email == pro_data["email"]))
-        if not result.scalars().first():
-            user = User(
-                email=pro_data["email"],
-                password_hash=password_hash,
-                full_name=pro_data["full_name"],
-                phone=pro_data["phone"],
-                role=UserRole.PRO.value,
-                service_category=pro_data["service_category"],
-                bio=pro_data["bio"],
-                latitude=pro_data["latitude"],
-                longitude=pro_data["longitude"],
-                address=pro_data["address"],
-                is_active=True
-            )
-            db.add(user)
-            
-            # Add availability for next 7 days (9 AM - 6 PM)
-            today = datetime.now()
-            for i in range(7):
-                day = today + timedelta(days=i)
-                avail = Availability(
-                    professional=user,  # Using relationship directly since user.id is generated on flush
-                    date=day.strftime("%Y-%m-%d"),
-                    start_time="09:00",
-                    end_time="18:00",
-                    is_recurring=False
-                )
-                db.add(avail)
-            
-            print(f"Seeded professional: {pro_data['full_name']}")
-
-    # 3. Seed Customers
-    for cust_data in CUSTOMERS:
-        result = await db.execute(select(User).where(User.email == cust_data["email"]))
-        if not result.scalars().first():
-            user = User(
-                email=cust_data["email"],
-                password_hash=password_hash,
-                full_name=cust_data["full_name"],
-                phone=cust_data["phone"],
-                role=UserRole.CUSTOMER.value,
-                address=cust_data["address"],
-                latitude=cust_data["latitude"],
-                longitude=cust_data["longitude"],
-                is_active=True
-            )
-            db.add(user)
-            print(f"Seeded customer: {cust_data['full_name']}")
-
-    await db.commit()
+
+    result = await db.execute(select(ServiceCategory.id).limit(1))
+    has_categories = result.first() is not None
+
+    # Skip users that already exist — one lookup for every seed email
+    seed_emails = [u["email"] for u in PROFESSIONALS + CUSTOMERS]
+    result = await db.execute(select(User.email).where(User.email.in_(seed_emails)))
+    existing_emails = set(result.scalars().all())
+    new_pros = [p for p in PROFESSIONALS if p["email"] not in existing_emails]
+    new_customers = [c for c in CUSTOMERS if c["email"] not in existing_emails]
+
+    tasks = []
+    if not has_categories:
+        tasks.append(_seed_categories())
+    if new_pros or new_customers:
+        password_hash = get_password_hash("password123")
+        if new_pros:
+            tasks.append(_seed_professionals(new_pros, password_hash))
+        if new_customers:
+            tasks.append(_seed_customers(new_customers, password_hash))
+
+    await asyncio.gather(*tasks)
     print("Database seeding completed.")
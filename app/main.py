@@ -1,21 +1,38 @@
+import asyncio
 from contextlib import asynccontextmanager
+from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
+from sqlalchemy import select
 from app.api.api import api_router
 from app.core.config import settings
 from app.db.database import init_db, close_db, AsyncSessionLocal
+from app.db.db_models import ServiceCategory
 from app.db.seed import seed_data
+from app.models.service import ServiceCategoryResponse
+from app.services.validate_service import close_http_client, load_embedding_model
+
+UPLOAD_DIR = "uploads"
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
-    # Startup: create tables and seed data
+    # Startup: ensure the uploads directory exists, create tables and seed data
+    Path(UPLOAD_DIR).mkdir(exist_ok=True)
     await init_db()
     async with AsyncSessionLocal() as session:
         await seed_data(session)
+        # Categories are static after seeding — keep them in memory
+        rows = (await session.execute(select(ServiceCategory))).scalars().all()
+        app.state.categories = {r.id: ServiceCategoryResponse.model_validate(r) for r in rows}
+    # Loaded in the background so the port opens without waiting for the model
+    embedding_load = asyncio.create_task(load_embedding_model())
     yield
-    # Shutdown: close database connections
+    # Shutdown: close the outbound HTTP client and database connections
+    embedding_load.cancel()
+    await close_http_client()
     await close_db()
 
 
@@ -25,21 +42,18 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Mount uploads directory
-import os
-from fastapi.staticfiles import StaticFiles
-UPLOAD_DIR = "uploads"
-if not os.path.exists(UPLOAD_DIR):
-    os.makedirs(UPLOAD_DIR)
-app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
+# Mount uploads directory (created in lifespan, so skip the import-time check)
+app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR, check_dir=False), name="uploads")
 
-# CORS configuration — allow all origins in development
+# CORS configuration — explicit allowlist; browsers cache preflights for a day
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # AnyHttpUrl normalizes to a trailing slash, Origin headers never have one
+    allow_origins=[str(origin).rstrip("/") for origin in settings.BACKEND_CORS_ORIGINS],
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
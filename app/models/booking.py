@@ -1,27 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
-from enum import Enum
-
-
-class RequestStatus(str, Enum):
-    OPEN = "open"
-    MATCHED = "matched"
-    BOOKED = "booked"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
-
-
-class RequestUrgency(str, Enum):
-    IMMEDIATE = "immediate"
-    SCHEDULED = "scheduled"
-
-
-class BookingStatus(str, Enum):
-    CONFIRMED = "confirmed"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
+# Enums are defined once, next to the columns they describe
+from app.db.db_models import RequestStatus, RequestUrgency, BookingStatus
 
 
 # ─── Service Request Schemas ─────────────────────────────────────────
@@ -58,6 +39,9 @@ class ServiceRequestResponse(BaseModel):
         from_attributes = True
 
 
+ServiceRequestListAdapter = TypeAdapter(List[ServiceRequestResponse])
+
+
 class ServiceRequestUpdate(BaseModel):
     status: Optional[str] = None
     description: Optional[str] = None
@@ -89,6 +73,9 @@ class BookingResponse(BaseModel):
         from_attributes = True
 
 
+BookingListAdapter = TypeAdapter(List[BookingResponse])
+
+
 class BookingStatusUpdate(BaseModel):
     status: BookingStatus
 
@@ -1,17 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
-from enum import Enum
-
-
-class MessageType(str, Enum):
-    TEXT = "text"
-    PRICE_PROPOSAL = "price_proposal"
-    PRICE_ACCEPT = "price_accept"
-    PRICE_REJECT = "price_reject"
-    SYSTEM = "system"
-    VOICE = "voice"
-    IMAGE = "image"
+# Enum is defined once, next to the column it describes
+from app.db.db_models import MessageType
 
 
 # ─── Chat Room Schemas ───────────────────────────────────────────────
@@ -62,6 +53,9 @@ class MessageResponse(BaseModel):
         from_attributes = True
 
 
+MessageListAdapter = TypeAdapter(List[MessageResponse])
+
+
 # ─── Availability Schemas ────────────────────────────────────────────
 
 class AvailabilityCreate(BaseModel):
@@ -87,6 +81,9 @@ class AvailabilityResponse(BaseModel):
         from_attributes = True
 
 
+AvailabilityListAdapter = TypeAdapter(List[AvailabilityResponse])
+
+
 class AvailabilityUpdate(BaseModel):
     date: Optional[str] = None
     start_time: Optional[str] = None
@@ -0,0 +1,25 @@
+from typing import Any, Iterable, Type, TypeVar
+from pydantic import BaseModel, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def from_orm_fast(cls: Type[ModelT], obj: Any, **overrides: Any) -> ModelT:
+    """Build a response model from a trusted ORM row, skipping validation.
+
+    Only for rows loaded from our own database — user-supplied payloads
+    (e.g. ServiceRequestCreate, MessageCreate) must still be validated.
+    Fields missing on ``obj`` fall back to the model defaults.
+    """
+    values = {
+        name: getattr(obj, name)
+        for name in cls.model_fields
+        if name not in overrides and hasattr(obj, name)
+    }
+    values.update(overrides)
+    return cls.model_construct(**values)
+
+
+def dump_list_json(adapter: TypeAdapter, cls: Type[BaseModel], rows: Iterable[Any]) -> bytes:
+    """Serialize trusted ORM rows to JSON in one pass through a prebuilt list adapter."""
+    return adapter.dump_json([from_orm_fast(cls, row) for row in rows])
@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import List, Dict, Optional
 
 try:
@@ -12,27 +13,39 @@ logger = logging.getLogger(__name__)
 
 class NotificationService:
     def __init__(self):
+        # Firebase is bootstrapped on first send, not at import
         self.initialized = False
-        if not _firebase_available:
-            logger.info("firebase-admin not installed. Push notifications will be mocked.")
+        self._init_attempted = False
+        self._lock = threading.Lock()
+
+    def _ensure_init(self) -> None:
+        if self._init_attempted:
             return
-        try:
-            # Check if already initialized (to avoid errors on reload)
-            if not firebase_admin._apps:
-                # Assuming google-services.json is in root
-                try:
-                    cred = credentials.Certificate("google-services.json")
-                    firebase_admin.initialize_app(cred)
+        with self._lock:
+            if self._init_attempted:
+                return
+            self._init_attempted = True
+            if not _firebase_available:
+                logger.info("firebase-admin not installed. Push notifications will be mocked.")
+                return
+            try:
+                # Check if already initialized (to avoid errors on reload)
+                if not firebase_admin._apps:
+                    # Assuming google-services.json is in root
+                    try:
+                        cred = credentials.Certificate("google-services.json")
+                        firebase_admin.initialize_app(cred)
+                        self.initialized = True
+                        logger.info("Firebase Admin initialized successfully")
+                    except Exception as e:
+                        logger.warning(f"Failed to load google-services.json: {e}. Push notifications will be mocked.")
+                else:
                     self.initialized = True
-                    logger.info("Firebase Admin initialized successfully")
-                except Exception as e:
-                    logger.warning(f"Failed to load google-services.json: {e}. Push notifications will be mocked.")
-            else:
-                self.initialized = True
-        except Exception as e:
-            logger.error(f"Firebase initialization error: {e}")
+            except Exception as e:
+                logger.error(f"Firebase initialization error: {e}")
 
     def send_multicast(self, tokens: List[str], title: str, body: str, data: Optional[Dict[str, str]] = None) -> None:
+        self._ensure_init()
         if not self.initialized:
             logger.info(f"[MOCK PUSH] To: {len(tokens)} devices | Title: {title} | Body: {body} | Data: {data}")
             return
@@ -72,13 +85,25 @@ async def send_notification_to_user(
     data: Optional[Dict[str, str]] = None
 ):
     """Fetch user's device tokens and send notification."""
+    await send_notification_to_users(db, [user_id], title, body, data)
+
+
+async def send_notification_to_users(
+    db: AsyncSession,
+    user_ids: List[str],
+    title: str,
+    body: str,
+    data: Optional[Dict[str, str]] = None
+):
+    """Fetch device tokens for several users in one query and send a single multicast."""
     try:
-        result = await db.execute(select(DeviceToken).where(DeviceToken.user_id == user_id))
-        tokens = [t.token for t in result.scalars().all()]
+        result = await db.execute(select(DeviceToken.token).where(DeviceToken.user_id.in_(user_ids)))
+        tokens = list(result.scalars().all())
         
         if tokens:
-            # data values must be strings
-            str_data = {k: str(v) for k, v in (data or {}).items()}
-            notification_service.send_multicast(tokens, title, body, str_data)
+            # FCM data values must be strings; callers already pass str, so only convert stragglers
+            if data is not None and any(not isinstance(v, str) for v in data.values()):
+                data = {k: str(v) for k, v in data.items()}
+            notification_service.send_multicast(tokens, title, body, data)
     except Exception as e:
-        logger.error(f"Error sending notification to user {user_id}: {e}")
+        logger.error(f"Error sending notification to users {user_ids}: {e}")
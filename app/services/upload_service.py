@@ -3,12 +3,21 @@ import cloudinary.uploader
 from fastapi import UploadFile, HTTPException
 from app.core.config import settings
 
-# Configure Cloudinary
-cloudinary.config(
-    cloud_name=settings.CLOUDINARY_CLOUD_NAME,
-    api_key=settings.CLOUDINARY_API_KEY,
-    api_secret=settings.CLOUDINARY_API_SECRET
-)
+_configured = False
+
+
+def _ensure_configured() -> None:
+    """Configure Cloudinary on first upload rather than at import."""
+    global _configured
+    if _configured:
+        return
+    cloudinary.config(
+        cloud_name=settings.CLOUDINARY_CLOUD_NAME,
+        api_key=settings.CLOUDINARY_API_KEY,
+        api_secret=settings.CLOUDINARY_API_SECRET
+    )
+    _configured = True
+
 
 class UploadService:
     @staticmethod
@@ -16,6 +25,7 @@ class UploadService:
         """
         Uploads a file to Cloudinary and returns the secure URL.
         """
+        _ensure_configured()
         try:
             # Read file content
             content = await file.read()
@@ -1,21 +1,33 @@
 """
 Smart description validation for service requests.
 
-Uses Google Gemini REST API (via httpx) for intelligent validation,
-with keyword-based fallback when Gemini is unavailable.
+Uses Google Gemini REST API (via a shared httpx AsyncClient) for intelligent
+validation, with keyword-based fallback when Gemini is unavailable.
 No external SDK required — uses httpx already in requirements.
 """
 
 import re
-import json
+import time
+import asyncio
+import hashlib
 import logging
 import httpx
-from typing import Dict, List, Set, Optional
+import orjson
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
 GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
 
+_TOKEN_RE = re.compile(r"[A-Za-z]+")
+_VOWELS = frozenset("aeiou")
+
 # ── Category display names ─────────────────────────────────────────
 
 CATEGORY_NAMES: Dict[str, str] = {
@@ -30,199 +42,471 @@ CATEGORY_NAMES: Dict[str, str] = {
 }
 
 
+# ── Example prompts ────────────────────────────────────────────────
+
+_EXAMPLES: Dict[str, str] = {
+    "plumbing": "e.g., Kitchen tap is leaking and needs replacement",
+    "electrician": "e.g., Power socket not working in the bedroom",
+    "cleaning": "e.g., Need deep cleaning for 2BHK apartment",
+    "painting": "e.g., Walls have cracks and need repainting",
+    "ac_repair": "e.g., AC not cooling properly, needs gas refill",
+    "salon": "e.g., Need a haircut and facial at home",
+    "pest_control": "e.g., Cockroach infestation in kitchen area",
+    "carpentry": "e.g., Wardrobe door hinge is broken",
+}
+
+
+def _example_for(category_id: str) -> str:
+    return _EXAMPLES.get(category_id, "e.g., Describe what needs to be fixed or serviced")
+
+
+# ── Gemini prompt ──────────────────────────────────────────────────
+
+# Everything except the description is static per category, so it goes in
+# systemInstruction: each call then shares an identical prefix with every
+# other call for that category, and only the short user turn varies.
+_SYSTEM_TEMPLATE = (
+    'You are a validator for a home-services app called SkillnScale.\n'
+    'The user selected the service category: "{category_name}"\n'
+    'The user message is the description they typed.\n\n'
+    'Determine if the description is a VALID, RELEVANT service request for "{category_name}".\n\n'
+    'Rules:\n'
+    '- VALID: describes a real problem or service need related to {category_name}. Informal/short is fine.\n'
+    '- INVALID: gibberish, unrelated to {category_name}, offensive, or not a service need.\n\n'
+    'Respond in EXACTLY this JSON format, nothing else:\n'
+    '{response_format}\n\n'
+    'If invalid, suggest something like: "This doesn\'t seem related to {category_name}. Try: {example}"\n'
+    'If valid, say: "Got it! We\'ll find you the right professional."'
+)
+
+# Passed in as a value (not written into the template) so its braces survive format
+_RESPONSE_FORMAT = '{"is_valid": true, "message": "one-line friendly feedback"}'
+
+
+def _category_meta(category_id: str) -> Tuple[str, str, str]:
+    """(display name, example suggestion, system instruction) for one category."""
+    name = CATEGORY_NAMES.get(category_id, category_id)
+    example = _example_for(category_id)
+    system = _SYSTEM_TEMPLATE.format_map({
+        "category_name": name,
+        "example": example,
+        "response_format": _RESPONSE_FORMAT,
+    })
+    return name, example, system
+
+
+_CAT_META: Dict[str, Tuple[str, str, str]] = {cid: _category_meta(cid) for cid in CATEGORY_NAMES}
+
+
+def _meta_for(category_id: str) -> Tuple[str, str, str]:
+    meta = _CAT_META.get(category_id)
+    return meta if meta is not None else _category_meta(category_id)
+
+
+# ── Gemini response cache ──────────────────────────────────────────
+
+class _TTLCache:
+    """Small in-process LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, max_entries: int = 500, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[dict]:
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                self.stats["hits"] += 1
+                return dict(value)
+            del self._data[key]
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: dict, expires_at: Optional[float] = None) -> None:
+        if expires_at is None:
+            expires_at = time.monotonic() + self.ttl
+        self._data[key] = (expires_at, dict(value))
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+
+class _SemanticCache:
+    """Nearest-neighbour cache over normalized description embeddings.
+
+    Rows live in a preallocated float32 matrix so a lookup is a single
+    matrix-vector product; once full, the oldest row is overwritten. Rows
+    expire after ``ttl`` seconds, like the exact-match cache.
+    """
+
+    def __init__(self, max_entries: int = 2000, threshold: float = 0.92, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl = ttl
+        self._matrix = None
+        self._categories: List[Optional[str]] = [None] * max_entries
+        self._values: List[Optional[dict]] = [None] * max_entries
+        self._expires: List[float] = [0.0] * max_entries
+        self._size = 0
+        self._next = 0
+
+    def lookup(self, category_id: str, embedding) -> Optional[Tuple[dict, float]]:
+        """Closest live row in ``category_id`` above the threshold, with its expiry."""
+        if self._size == 0:
+            return None
+        now = time.monotonic()
+        sims = self._matrix[:self._size] @ embedding
+        for i in np.argsort(sims)[::-1]:
+            if sims[i] <= self.threshold:
+                return None
+            if self._categories[i] == category_id and self._expires[i] > now:
+                return dict(self._values[i]), self._expires[i]
+        return None
+
+    def add(self, category_id: str, embedding, value: dict) -> None:
+        if self._matrix is None:
+            self._matrix = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+        i = self._next
+        self._matrix[i] = embedding
+        self._categories[i] = category_id
+        self._values[i] = dict(value)
+        self._expires[i] = time.monotonic() + self.ttl
+        self._next = (i + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+
+_gemini_cache = _TTLCache()
+_semantic_cache = _SemanticCache()
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+_embedding_model = None
+
+
+async def load_embedding_model() -> None:
+    """Load the sentence-transformers model off the event loop.
+
+    Started in the background at app startup when SEMANTIC_CACHE_ENABLED is
+    set and Gemini is configured. Until it finishes, or if the packages or
+    weights are missing, only the exact-match cache is used.
+    """
+    global _embedding_model
+    from app.core.config import settings
+    if not settings.SEMANTIC_CACHE_ENABLED or not settings.GEMINI_API_KEY:
+        return
+    if np is None:
+        logger.info("numpy not installed; using exact-match cache only")
+        return
+    try:
+        from sentence_transformers import SentenceTransformer
+        _embedding_model = await asyncio.to_thread(SentenceTransformer, EMBEDDING_MODEL_NAME)
+    except Exception as e:
+        logger.info(f"Semantic cache disabled ({e}); using exact-match cache only")
+
+
+def _cache_key(category_id: str, normalized: str) -> str:
+    return hashlib.sha256(f"{category_id}\0{normalized}".encode("utf-8")).hexdigest()
+
+
 # ── Gemini REST API validation ─────────────────────────────────────
 
-def _validate_with_gemini(category_id: str, description: str) -> Optional[dict]:
-    """Call Gemini REST API directly via httpx (sync)."""
+# A shared client keeps the TLS connection to Gemini alive between calls
+_HTTP_TIMEOUT = httpx.Timeout(8.0, connect=3.0)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Create the shared AsyncClient lazily, inside the running event loop."""
+    global _async_http_client
+    if _async_http_client is None:
+        _async_http_client = httpx.AsyncClient(http2=True, timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+    return _async_http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Gemini client. Called at app shutdown."""
+    global _async_http_client
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+
+
+def _gemini_api_key() -> Optional[str]:
     try:
         from app.core.config import settings
         api_key = settings.GEMINI_API_KEY
         if not api_key:
             logger.info("GEMINI_API_KEY is empty, using keyword fallback")
             return None
-        logger.info(f"Calling Gemini API for category={category_id}")
+        return api_key
     except Exception as e:
         logger.warning(f"Failed to load GEMINI_API_KEY: {e}")
         return None
 
-    category_name = CATEGORY_NAMES.get(category_id, category_id)
-    example = _example_for(category_id)
 
-    prompt = (
-        f'You are a validator for a home-services app called SkillnScale.\n'
-        f'The user selected the service category: "{category_name}"\n'
-        f'The user typed this description: "{description}"\n\n'
-        f'Determine if the description is a VALID, RELEVANT service request for "{category_name}".\n\n'
-        f'Rules:\n'
-        f'- VALID: describes a real problem or service need related to {category_name}. Informal/short is fine.\n'
-        f'- INVALID: gibberish, unrelated to {category_name}, offensive, or not a service need.\n\n'
-        f'Respond in EXACTLY this JSON format, nothing else:\n'
-        f'{{"is_valid": true, "message": "one-line friendly feedback"}}\n\n'
-        f'If invalid, suggest something like: "This doesn\'t seem related to {category_name}. Try: {example}"\n'
-        f'If valid, say: "Got it! We\'ll find you the right professional."'
-    )
+async def _cache_lookup(category_id: str, description: str) -> Tuple[Optional[dict], str, Any]:
+    """Return (cached result or None, exact cache key, embedding or None)."""
+    # Normalize so "Leaky tap!" and "leaky tap" share an entry
+    normalized = " ".join(_tokenize(description))
+    cache_key = _cache_key(category_id, normalized)
+    cached = _gemini_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Gemini cache hit for category={category_id} (stats={_gemini_cache.stats})")
+        return cached, cache_key, None
+
+    # Paraphrases ("tap leaking" / "faucet dripping") hit the semantic cache
+    embedding = None
+    if _embedding_model is not None:
+        # encode is CPU-bound; keep it off the event loop
+        embedding = await asyncio.to_thread(_embedding_model.encode, normalized, normalize_embeddings=True)
+        hit = _semantic_cache.lookup(category_id, embedding)
+        if hit is not None:
+            cached, expires_at = hit
+            logger.info(f"Gemini semantic cache hit for category={category_id}")
+            # Keep the source row's expiry so a hit never extends a result's life
+            _gemini_cache.set(cache_key, cached, expires_at)
+            return cached, cache_key, embedding
+
+    logger.info(f"Calling Gemini API for category={category_id} (cache stats={_gemini_cache.stats})")
+    return None, cache_key, embedding
+
+
+def _cache_store(category_id: str, cache_key: str, embedding: Any, validation: dict) -> None:
+    _gemini_cache.set(cache_key, validation)
+    if embedding is not None:
+        _semantic_cache.add(category_id, embedding, validation)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# JSON mode: Gemini returns bare JSON matching this schema, never markdown
+_GENERATION_CONFIG = {
+    "temperature": 0.1,
+    "maxOutputTokens": 60,
+    "responseMimeType": "application/json",
+    "responseSchema": {
+        "type": "OBJECT",
+        "properties": {
+            "is_valid": {"type": "BOOLEAN"},
+            "message": {"type": "STRING"},
+        },
+        "required": ["is_valid", "message"],
+    },
+}
+
 
-    try:
-        resp = httpx.post(
-            f"{GEMINI_API_URL}?key={api_key}",
-            json={
-                "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {"temperature": 0.1, "maxOutputTokens": 150},
-            },
-            timeout=8.0,
-        )
+def _gemini_payload(category_id: str, description: str) -> dict:
+    system = _meta_for(category_id)[2]
 
-        if resp.status_code != 200:
-            logger.warning(f"Gemini API returned {resp.status_code}: {resp.text[:200]}")
-            return None
+    return {
+        "systemInstruction": {"parts": [{"text": system}]},
+        "contents": [{"role": "user", "parts": [{"text": description}]}],
+        "generationConfig": _GENERATION_CONFIG,
+    }
 
-        data = resp.json()
-        text = data["candidates"][0]["content"]["parts"][0]["text"].strip()
 
-        # Strip markdown fences if present
-        if text.startswith("```"):
-            text = re.sub(r"^```\w*\n?", "", text)
-            text = re.sub(r"\n?```$", "", text)
-            text = text.strip()
+def _parse_gemini_response(resp: httpx.Response, category_id: str) -> Optional[dict]:
+    if resp.status_code != 200:
+        logger.warning(f"Gemini API returned {resp.status_code}: {resp.text[:200]}")
+        return None
 
-        result = json.loads(text)
-        return {
-            "is_valid": bool(result.get("is_valid", False)),
-            "message": result.get("message", ""),
-            "suggestion": _example_for(category_id) if not result.get("is_valid") else None,
-        }
+    data = orjson.loads(resp.content)
+    text = data["candidates"][0]["content"]["parts"][0]["text"]
+    result = orjson.loads(text)
+    return {
+        "is_valid": bool(result.get("is_valid", False)),
+        "message": result.get("message", ""),
+        "suggestion": _meta_for(category_id)[1] if not result.get("is_valid") else None,
+    }
+
+
+async def _validate_with_gemini(category_id: str, description: str) -> Optional[dict]:
+    """Call Gemini REST API via the shared AsyncClient."""
+    api_key = _gemini_api_key()
+    if api_key is None:
+        return None
+
+    cached, cache_key, embedding = await _cache_lookup(category_id, description)
+    if cached is not None:
+        return cached
+
+    try:
+        resp = await _get_async_http_client().post(
+            GEMINI_API_URL,
+            params={"key": api_key},
+            content=orjson.dumps(_gemini_payload(category_id, description)),
+            headers=_JSON_HEADERS,
+        )
+        validation = _parse_gemini_response(resp, category_id)
     except Exception as e:
         logger.warning(f"Gemini validation error: {e}")
         return None
 
+    if validation is not None:
+        _cache_store(category_id, cache_key, embedding, validation)
+    return validation
+
 
 # ── Keyword-based fallback ─────────────────────────────────────────
 
-CATEGORY_KEYWORDS: Dict[str, Set[str]] = {
-    "plumbing": {
+CATEGORY_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "plumbing": frozenset({
         "tap", "faucet", "leak", "leaking", "pipe", "drain", "clogged",
         "blocked", "sink", "toilet", "flush", "shower", "geyser", "heater",
         "water", "drip", "valve", "tank", "pipeline", "sewage", "bathroom",
         "kitchen", "basin", "mixer", "plumber", "plumbing", "fitting",
-    },
-    "electrician": {
+    }),
+    "electrician": frozenset({
         "wire", "wiring", "switch", "socket", "plug", "light", "bulb",
         "fan", "circuit", "breaker", "mcb", "fuse", "short", "spark",
         "voltage", "inverter", "battery", "board", "panel", "electric",
         "electrical", "current", "power", "meter", "led", "tube",
-    },
-    "cleaning": {
+    }),
+    "cleaning": frozenset({
         "clean", "cleaning", "dust", "dirty", "stain", "wash", "mop",
         "sweep", "scrub", "deep", "carpet", "sofa", "upholstery",
         "kitchen", "bathroom", "floor", "tile", "window", "glass",
         "mattress", "sanitize", "disinfect", "polish",
-    },
-    "painting": {
+    }),
+    "painting": frozenset({
         "paint", "painting", "wall", "ceiling", "color", "colour",
         "primer", "putty", "waterproof", "crack", "peel", "peeling",
         "texture", "coat", "enamel", "exterior", "interior", "damp",
-    },
-    "ac_repair": {
+    }),
+    "ac_repair": frozenset({
         "ac", "air", "conditioner", "conditioning", "cooling", "cool",
         "compressor", "gas", "refrigerant", "filter", "coil", "split",
         "thermostat", "temperature", "frost", "noise", "servicing",
-    },
-    "salon": {
+    }),
+    "salon": frozenset({
         "hair", "haircut", "cut", "trim", "style", "facial", "face",
         "skin", "makeup", "bridal", "spa", "massage", "nail", "manicure",
         "pedicure", "wax", "waxing", "threading", "bleach", "grooming",
-    },
-    "pest_control": {
+    }),
+    "pest_control": frozenset({
         "pest", "cockroach", "roach", "termite", "rat", "mice", "mouse",
         "mosquito", "ant", "bug", "insect", "spider", "bedbug", "lizard",
         "infestation", "fumigation", "spray",
-    },
-    "carpentry": {
+    }),
+    "carpentry": frozenset({
         "wood", "wooden", "furniture", "door", "cabinet", "shelf",
         "table", "chair", "bed", "wardrobe", "drawer", "cupboard",
         "frame", "hinge", "lock", "handle", "laminate", "plywood",
         "carpenter", "carpentry", "assemble", "dismantle",
-    },
+    }),
 }
 
-GENERIC_KEYWORDS: Set[str] = {
+GENERIC_KEYWORDS: FrozenSet[str] = frozenset({
     "repair", "fix", "broken", "damage", "damaged", "replace",
     "install", "maintain", "service", "check", "inspect",
     "not", "working", "problem", "issue", "help", "need",
     "emergency", "urgent", "change", "setup", "fitting", "work",
-}
+})
 
 MIN_WORDS = 3
 
+# Category keyword hits at which the fallback is trusted without asking Gemini
+STRONG_KEYWORD_HITS = 2
+
+# Each category keyword gets one bit; a category is the OR of its words' bits,
+# so matching a description is a popcount of (token bits & category mask)
+_KEYWORD_BITS: Dict[str, int] = {
+    word: 1 << i
+    for i, word in enumerate(sorted(set().union(*CATEGORY_KEYWORDS.values())))
+}
+_CAT_MASKS: Dict[str, int] = {
+    cat: sum(_KEYWORD_BITS[w] for w in words)
+    for cat, words in CATEGORY_KEYWORDS.items()
+}
+
 
 def _tokenize(text: str) -> List[str]:
-    return re.findall(r"[a-zA-Z]+", text.lower())
+    return _TOKEN_RE.findall(text.lower())
 
 
 def _is_gibberish(word: str) -> bool:
-    if len(word) < 4:
-        return False
-    return not bool(re.search(r"[aeiou]", word.lower()))
+    # ``word`` is a token of lowercased text, so vowels are lowercase too
+    return len(word) >= 4 and _VOWELS.isdisjoint(word)
 
 
-def _validate_with_keywords(category_id: str, description: str) -> dict:
-    tokens = _tokenize(description)
+def _keyword_check(category_id: str, description: str) -> Tuple[dict, int]:
+    """Keyword validation plus the number of category keyword hits."""
+    category_name, example, _ = _meta_for(category_id)
+    text = description.lower()
+    tokens = _TOKEN_RE.findall(text)
 
     if len(tokens) < MIN_WORDS:
         return {
             "is_valid": False,
             "message": "Please provide more details about your issue.",
-            "suggestion": _example_for(category_id),
-        }
-
-    gibberish_count = sum(1 for t in tokens if _is_gibberish(t))
-    if gibberish_count > len(tokens) * 0.5:
+            "suggestion": example,
+        }, 0
+
+    gibberish_limit = len(tokens) * 0.5
+    gibberish_count = 0
+    token_mask = 0
+    if _VOWELS.isdisjoint(text):
+        # No vowel anywhere: every 4+ letter token is gibberish, so skip the
+        # vowel checks; shorter tokens can still be keywords (e.g. "mcb")
+        for t in tokens:
+            if len(t) >= 4:
+                gibberish_count += 1
+            else:
+                token_mask |= _KEYWORD_BITS.get(t, 0)
+    else:
+        # One pass for both checks; stop as soon as gibberish is a majority
+        for t in tokens:
+            if _is_gibberish(t):
+                gibberish_count += 1
+                if gibberish_count > gibberish_limit:
+                    break
+                continue  # every keyword of 4+ letters has a vowel, so not a hit
+            bit = _KEYWORD_BITS.get(t)
+            if bit is not None:
+                token_mask |= bit
+
+    if gibberish_count > gibberish_limit:
         return {
             "is_valid": False,
             "message": "That doesn't look like a valid description.",
-            "suggestion": _example_for(category_id),
-        }
+            "suggestion": example,
+        }, 0
 
-    token_set = set(tokens)
-    cat_keywords = CATEGORY_KEYWORDS.get(category_id, set())
-    cat_matches = token_set & cat_keywords
-    generic_matches = token_set & GENERIC_KEYWORDS
+    # Distinct category keywords present (bin().count: int.bit_count needs 3.10)
+    cat_hits = bin(token_mask & _CAT_MASKS.get(category_id, 0)).count("1")
 
     # Must have at least one category-specific keyword
-    if len(cat_matches) == 0:
-        category_name = CATEGORY_NAMES.get(category_id, category_id)
+    if cat_hits == 0:
         return {
             "is_valid": False,
             "message": f"This doesn't seem related to {category_name}. Please describe a specific {category_name.lower()} issue.",
-            "suggestion": _example_for(category_id),
-        }
+            "suggestion": example,
+        }, 0
 
-    return {"is_valid": True, "message": "Looks good!", "suggestion": None}
+    return {"is_valid": True, "message": "Looks good!", "suggestion": None}, cat_hits
 
 
-# ── Main entry point ───────────────────────────────────────────────
+def _validate_with_keywords(category_id: str, description: str) -> dict:
+    return _keyword_check(category_id, description)[0]
 
-def validate_service_description(category_id: str, description: str) -> dict:
-    """Validate with Gemini LLM first; keyword fallback if unavailable."""
-    result = _validate_with_gemini(category_id, description)
-    if result is not None:
-        return result
-    return _validate_with_keywords(category_id, description)
 
+# ── Main entry point ───────────────────────────────────────────────
 
-# ── Example prompts ────────────────────────────────────────────────
-
-_EXAMPLES: Dict[str, str] = {
-    "plumbing": "e.g., Kitchen tap is leaking and needs replacement",
-    "electrician": "e.g., Power socket not working in the bedroom",
-    "cleaning": "e.g., Need deep cleaning for 2BHK apartment",
-    "painting": "e.g., Walls have cracks and need repainting",
-    "ac_repair": "e.g., AC not cooling properly, needs gas refill",
-    "salon": "e.g., Need a haircut and facial at home",
-    "pest_control": "e.g., Cockroach infestation in kitchen area",
-    "carpentry": "e.g., Wardrobe door hinge is broken",
-}
+async def validate_service_description(category_id: str, description: str) -> dict:
+    """Validate with Gemini LLM; keyword fallback if unavailable.
 
+    Descriptions with several obvious category keywords are accepted
+    without a Gemini round-trip.
+    """
+    kw_result, cat_hits = _keyword_check(category_id, description)
+    if kw_result["is_valid"] and cat_hits >= STRONG_KEYWORD_HITS:
+        return kw_result
 
-def _example_for(category_id: str) -> str:
-    return _EXAMPLES.get(category_id, "e.g., Describe what needs to be fixed or serviced")
+    result = await _validate_with_gemini(category_id, description)
+    if result is not None:
+        return result
+    return kw_result
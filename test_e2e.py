@@ -1,10 +1,20 @@
 import asyncio
+import os
 import httpx
 import random
 import string
 
-BASE_URL = "https://skillnscale-backend.onrender.com/api/v1"
-# BASE_URL = "http://localhost:8000/api/v1" # Uncomment for local testing
+from tests.http_client import make_transport
+
+# Set TEST_BASE_URL (e.g. http://localhost:8000/api/v1) for local testing
+BASE_URL = os.environ.get("TEST_BASE_URL", "https://skillnscale-backend.onrender.com/api/v1")
+
+# Seeded category id (see app/db/seed.py) — avoids depending on list ordering
+CATEGORY_ID = "plumbing"
+
+# Set E2E_SEED to reproduce a run's phone numbers and names
+if os.environ.get("E2E_SEED"):
+    random.seed(os.environ["E2E_SEED"])
 
 def random_string(length=8):
     return ''.join(random.choices(string.ascii_lowercase, k=length))
@@ -13,66 +23,89 @@ def random_phone():
     return f"9{random.randint(100000000, 999999999)}"
 
 async def run_e2e_test():
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with httpx.AsyncClient(timeout=30.0, transport=make_transport()) as client:
         print(f"🚀 Starting E2E Test against {BASE_URL}")
         
-        # 0. Health Check with Retry
-        max_retries = 6
+        # 0. Health Check with Retry (exponential backoff)
+        retry_delays = [1, 2, 4, 8, 16, 30]
+        max_retries = len(retry_delays) + 1
         for i in range(max_retries):
             try:
                 print(f"Health check attempt {i+1}/{max_retries}...")
-                resp = await client.get(f"{BASE_URL.replace('/api/v1', '')}/health")
+                resp = await asyncio.wait_for(
+                    client.get(f"{BASE_URL.replace('/api/v1', '')}/health"),
+                    timeout=5.0,
+                )
                 if resp.status_code == 200:
                     print(f"✅ Health Check passed: {resp.json()}")
                     break
                 else:
                     print(f"Health Check: {resp.status_code} {resp.text}")
             except Exception as e:
-                print(f"Health check failed: {e}")
-            
+                print(f"Health check failed: {e!r}")
+
             if i < max_retries - 1:
-                print("Waiting 10s for service to wake up/deploy...")
-                await asyncio.sleep(10)
+                delay = retry_delays[i]
+                print(f"Waiting {delay}s for service to wake up/deploy...")
+                await asyncio.sleep(delay)
         else:
             print("❌ Service unobtainable after retries.")
             return
 
-        # 1. Signup Customer
+        # 1. Signup Customer and Professional (independent, so in parallel)
+        category_id = CATEGORY_ID
         cust_phone = random_phone()
         cust_password = "password123"
-        print(f"\n[1] Signing up Customer ({cust_phone})...")
-        resp = await client.post(f"{BASE_URL}/auth/signup/customer", json={
-            "phone": cust_phone,
-            "password": cust_password,
-            "full_name": f"Test Customer {random_string()}"
-        })
-        if resp.status_code != 200:
-            print(f"❌ Signup failed: {resp.status_code} - {resp.text}")
+        pro_phone = random_phone()
+        pro_password = "password123"
+        print(f"\n[1] Signing up Customer ({cust_phone}) and Professional ({pro_phone})...")
+        cust_resp, pro_resp = await asyncio.gather(
+            client.post(f"{BASE_URL}/auth/signup/customer", json={
+                "phone": cust_phone,
+                "password": cust_password,
+                "full_name": f"Test Customer {random_string()}"
+            }),
+            client.post(f"{BASE_URL}/auth/signup/pro", json={
+                "phone": pro_phone,
+                "password": pro_password,
+                "full_name": f"Test Pro {random_string()}",
+                "service_category": category_id
+            }),
+        )
+        if cust_resp.status_code != 200:
+            print(f"❌ Signup failed: {cust_resp.status_code} - {cust_resp.text}")
             return
         print("✅ Customer signed up")
+        if pro_resp.status_code != 200:
+            print(f"❌ Pro Signup failed: {pro_resp.text}")
+            return
+        print("✅ Professional signed up")
 
-        # 2. Login Customer
-        print(f"\n[2] Logging in Customer...")
-        resp = await client.post(f"{BASE_URL}/auth/login/json", json={
-            "phone": cust_phone,
-            "password": cust_password
-        })
-        if resp.status_code != 200:
-            print(f"❌ Login failed: {resp.text}")
+        # 2. Login Customer and Professional
+        print(f"\n[2] Logging in Customer and Professional...")
+        cust_resp, pro_resp = await asyncio.gather(
+            client.post(f"{BASE_URL}/auth/login/json", json={
+                "phone": cust_phone,
+                "password": cust_password
+            }),
+            client.post(f"{BASE_URL}/auth/login/json", json={
+                "phone": pro_phone,
+                "password": pro_password
+            }),
+        )
+        if cust_resp.status_code != 200:
+            print(f"❌ Login failed: {cust_resp.text}")
             return
-        cust_token = resp.json()["access_token"]
+        cust_token = cust_resp.json()["access_token"]
         print("✅ Customer logged in")
+        if pro_resp.status_code != 200:
+            print(f"❌ Pro Login failed: {pro_resp.text}")
+            return
+        pro_token = pro_resp.json()["access_token"]
+        print("✅ Professional logged in")
 
-        # 3. Create Service Request
+        # 3. Create Service Request (needs the customer token)
         print(f"\n[3] Creating Service Request...")
-        # First, we need a category ID. Fetch categories.
-        resp = await client.get(f"{BASE_URL}/services/categories")
-        categories = resp.json()
-        if not categories:
-            print("❌ No categories found to create request")
-            return
-        category_id = categories[0]["id"]
-        
         request_data = {
             "category_id": category_id,
             "title": "Leaking Tap",
@@ -95,34 +128,8 @@ async def run_e2e_test():
         request_id = resp.json()["id"]
         print(f"✅ Request created (ID: {request_id})")
 
-        # 4. Signup Professional
-        pro_phone = random_phone()
-        print(f"\n[4] Signing up Professional ({pro_phone})...")
-        resp = await client.post(f"{BASE_URL}/auth/signup/pro", json={
-            "phone": pro_phone,
-            "password": "password123",
-            "full_name": f"Test Pro {random_string()}",
-            "service_category": category_id
-        })
-        if resp.status_code != 200:
-            print(f"❌ Pro Signup failed: {resp.text}")
-            return
-        print("✅ Professional signed up")
-
-        # 5. Login Professional
-        print(f"\n[5] Logging in Professional...")
-        resp = await client.post(f"{BASE_URL}/auth/login/json", json={
-            "phone": pro_phone,
-            "password": "password123"
-        })
-        if resp.status_code != 200:
-            print(f"❌ Pro Login failed: {resp.text}")
-            return
-        pro_token = resp.json()["access_token"]
-        print("✅ Professional logged in")
-
-        # 6. Pro Views Open Requests
-        print(f"\n[6] Pro fetching open requests...")
+        # 4. Pro Views Open Requests
+        print(f"\n[4] Pro fetching open requests...")
         resp = await client.get(
             f"{BASE_URL}/requests/open",
             params={"category": category_id},
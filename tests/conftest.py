@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures for the live-server flow tests in this directory.
+
+The flows talk to a running backend. The whole session shares one event
+loop and one AsyncClient, so every test reuses the same keep-alive
+connections instead of opening its own.
+
+Install the test dependencies with ``pip install -r requirements-dev.txt``,
+then run them all in one process with ``pytest tests/`` (point TEST_BASE_URL
+at the backend); each file also still runs standalone as a script.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from http_client import BASE_URL, make_transport
+
+
+@pytest.fixture(scope="session")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def run(loop):
+    """Run a flow coroutine to completion on the session loop."""
+    return loop.run_until_complete
+
+
+@pytest.fixture(scope="session")
+def client(loop):
+    client = httpx.AsyncClient(base_url=BASE_URL, timeout=15.0, transport=make_transport())
+    yield client
+    loop.run_until_complete(client.aclose())
+
+
+@pytest.fixture(scope="session")
+def categories(client, run):
+    """Service categories, fetched once for the whole session.
+
+    Also the reachability probe: tests that request it are skipped when no
+    backend is running.
+    """
+    try:
+        resp = run(client.get("/services/categories"))
+    except httpx.TransportError:
+        pytest.skip(f"No backend running at {BASE_URL}")
+    assert resp.status_code == 200, f"Categories failed: {resp.text}"
+    return resp.json()
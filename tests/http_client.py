@@ -0,0 +1,27 @@
+"""
+HTTP client settings and helpers shared by the flow tests, their pytest
+fixtures and the standalone scripts. Plain module (no pytest import) so the
+scripts run without the test dependencies.
+"""
+import os
+import socket
+import uuid
+
+import httpx
+
+BASE_URL = os.environ.get("TEST_BASE_URL", "http://127.0.0.1:8000/api/v1")
+# One keep-alive pool per client, so every call reuses the same connection(s)
+LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60.0)
+# Small request bodies go out immediately (no Nagle delay), with roomy send buffers
+SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), (socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)]
+
+
+def make_transport() -> httpx.AsyncHTTPTransport:
+    """Pooled HTTP/2 transport for one AsyncClient."""
+    return httpx.AsyncHTTPTransport(http2=True, limits=LIMITS, retries=0, socket_options=SOCKET_OPTIONS)
+
+
+def make_suffix() -> str:
+    """Unique tag for per-run account emails."""
+    # Worker id keeps pytest-xdist workers apart; 12 hex chars keep reruns apart
+    return f"{os.environ.get('PYTEST_XDIST_WORKER', 'main')}_{uuid.uuid4().hex[:12]}"
@@ -1,132 +0,0 @@
-import httpx
-import uuid
-import time
-import os
-
-BASE_URL = "http://localhost:8000/api/v1"
-
-def run_test():
-    print(f"Testing against {BASE_URL}")
-    suffix = str(uuid.uuid4())[:8]
-    cust_email = f"cust_{suffix}@test.com"
-    pro_email = f"pro_{suffix}@test.com"
-    password = "password123"
-
-    with httpx.Client(base_url=BASE_URL, timeout=10.0) as client:
-        # 1. Register Customer
-        print(f"\n[1] Registering Customer: {cust_email}")
-        resp = client.post("/auth/signup", json={"email": cust_email, "password": password, "full_name": "Test Customer", "role": "customer"})
-        assert resp.status_code == 200, f"Signup failed: {resp.text}"
-        
-        # 2. Login Customer
-        print("[2] Logging in Customer...")
-        resp = client.post("/auth/login", data={"username": cust_email, "password": password})
-        assert resp.status_code == 200, f"Login failed: {resp.text}"
-        tokens = resp.json()
-        cust_token = tokens["access_token"]
-        cust_refresh = tokens["refresh_token"]
-        cust_headers = {"Authorization": f"Bearer {cust_token}"}
-        print("    Got access and refresh tokens.")
-
-        # 3. Test Refresh Token
-        print("[3] Testing Token Refresh...")
-        resp = client.post("/auth/refresh", json={"refresh_token": cust_refresh})
-        assert resp.status_code == 200, f"Refresh failed: {resp.text}"
-        new_token = resp.json()["access_token"]
-        print("    Token refreshed successfully.")
-
-        # 4. Register & Login Pro
-        print(f"\n[4] Registering & Logging in Pro: {pro_email}")
-        client.post("/auth/signup", json={"email": pro_email, "password": password, "full_name": "Test Pro", "role": "pro"})
-        resp = client.post("/auth/login", data={"username": pro_email, "password": password})
-        pro_token = resp.json()["access_token"]
-        pro_headers = {"Authorization": f"Bearer {pro_token}"}
-        
-        # 5. File Upload (Mock Image)
-        print("\n[5] Testing File Upload...")
-        # Create a dummy image file
-        with open("test_image.png", "wb") as f:
-            f.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82")
-        
-        files = {"file": ("test_image.png", open("test_image.png", "rb"), "image/png")}
-        resp = client.post("/uploads/", files=files, headers=cust_headers)
-        if resp.status_code == 200:
-            print(f"    Upload success: {resp.json()['url']}")
-        else:
-            print(f"    Upload failed: {resp.text} (Proceeding, maybe dir issue)")
-        os.remove("test_image.png")
-
-        # 6. Notification Token Registration
-        print("\n[6] Registering Device Token...")
-        resp = client.post("/notifications/device-token", 
-                           json={"token": f"fcm_token_{suffix}", "platform": "android"}, 
-                           headers=cust_headers)
-        assert resp.status_code == 200, f"Token reg failed: {resp.text}"
-        print("    Device token registered.")
-
-        # 7. Create Service Request (New API)
-        print("\n[7] Creating Service Request...")
-        # Get category first
-        cats = client.get("/services/categories", headers=cust_headers).json()
-        cat_id = cats[0]['id'] if cats else "general"
-        
-        req_payload = {
-            "title": "Leaky Faucet",
-            "description": "Need urgent fix",
-            "category_id": cat_id,
-            "location": "123 Main St",
-            "scheduled_at": "2026-12-25T10:00:00"
-        }
-        resp = client.post("/requests/", json=req_payload, headers=cust_headers)
-        assert resp.status_code == 200, f"Request failed: {resp.text}"
-        req_id = resp.json()['id']
-        print(f"    Request created: {req_id}")
-
-        # 8. Create Chat Room
-        print("\n[8] Creating Chat Room...")
-        # Pro initiates chat ? No, customer initiates usually, or pro starts from open request?
-        # Let's say customer starts chat with a pro they found. 
-        # For test, we need pro ID. 
-        # Let's use `POST /bookings/` legacy flow to just get a booking quickly to test tracking?
-        # Or better, let's just create a Booking directly via legacy endpoint which is easier for now.
-        
-        print("    Creating Legacy Booking for Tracking Test...")
-        booking_payload = {
-            "service_id": cat_id,
-            "address": "123 Map St",
-            "scheduled_at": "2026-12-30T09:00:00",
-            "notes": "Tracking Test"
-        }
-        resp = client.post("/bookings/", json=booking_payload, headers=cust_headers)
-        booking_id = resp.json()['id']
-        print(f"    Booking created: {booking_id}")
-        
-        # Pro accepts
-        client.post(f"/bookings/{booking_id}/accept", headers=pro_headers)
-        print("    Pro accepted booking.")
-
-        # 9. Map Tracking
-        print("\n[9] Testing Map Tracking...")
-        # Pro updates location
-        lat, lng = 28.6139, 77.2090 # New Delhi
-        resp = client.put("/pro/location", json={"latitude": lat, "longitude": lng}, headers=pro_headers)
-        assert resp.status_code == 200, f"Location update failed: {resp.text}"
-        print("    Pro location updated.")
-        
-        # Cust fetches location
-        resp = client.get(f"/bookings/{booking_id}/location", headers=cust_headers)
-        assert resp.status_code == 200, f"Get location failed: {resp.text}"
-        loc_data = resp.json()
-        print(f"    Customer fetched location: {loc_data}")
-        assert loc_data['latitude'] == lat, "Latitude mismatch"
-        assert loc_data['longitude'] == lng, "Longitude mismatch"
-        print("    Map tracking verified!")
-
-    print("\n✅ Integration Test Completed Successfully!")
-
-if __name__ == "__main__":
-    try:
-        run_test()
-    except Exception as e:
-        print(f"\n❌ Test Failed: {e}")
-        exit(1)
@@ -0,0 +1,149 @@
+import asyncio
+import httpx
+import io
+import time
+
+from http_client import BASE_URL, make_suffix, make_transport
+
+# 1x1 PNG for the upload test, sent from memory
+PNG_BYTES = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
+
+# Fixed payloads; emails and the category id are filled in per run
+PASSWORD = "password123"
+CUSTOMER_SIGNUP = {"password": PASSWORD, "full_name": "Test Customer", "role": "customer"}
+PRO_SIGNUP = {"password": PASSWORD, "full_name": "Test Pro", "role": "pro"}
+REQUEST_BASE = {
+    "title": "Leaky Faucet",
+    "description": "Need urgent fix",
+    "location": "123 Main St",
+    "scheduled_at": "2026-12-25T10:00:00"
+}
+BOOKING_BASE = {
+    "address": "123 Map St",
+    "scheduled_at": "2026-12-30T09:00:00",
+    "notes": "Tracking Test"
+}
+
+async def run_test(client: httpx.AsyncClient, categories=None):
+    print(f"Testing against {client.base_url}")
+    suffix = make_suffix()
+    cust_email = f"cust_{suffix}@test.com"
+    pro_email = f"pro_{suffix}@test.com"
+
+    # 1. Register Customer & Pro (independent, so sent together)
+    print(f"\n[1] Registering Customer: {cust_email} and Pro: {pro_email}")
+    cust_resp, pro_resp = await asyncio.gather(
+        client.post("/auth/signup", json={**CUSTOMER_SIGNUP, "email": cust_email}),
+        client.post("/auth/signup", json={**PRO_SIGNUP, "email": pro_email}),
+    )
+    assert cust_resp.status_code == 200, f"Signup failed: {cust_resp.text}"
+    assert pro_resp.status_code == 200, f"Pro signup failed: {pro_resp.text}"
+
+    # 2. Login Customer & Pro
+    print("[2] Logging in Customer and Pro...")
+    cust_resp, pro_resp = await asyncio.gather(
+        client.post("/auth/login", data={"username": cust_email, "password": PASSWORD}),
+        client.post("/auth/login", data={"username": pro_email, "password": PASSWORD}),
+    )
+    assert cust_resp.status_code == 200, f"Login failed: {cust_resp.text}"
+    assert pro_resp.status_code == 200, f"Pro login failed: {pro_resp.text}"
+    tokens = cust_resp.json()
+    pro_tokens = pro_resp.json()
+    cust_token = tokens["access_token"]
+    cust_refresh = tokens["refresh_token"]
+    cust_headers = {"Authorization": f"Bearer {cust_token}"}
+    print("    Got access and refresh tokens.")
+    pro_token = pro_tokens["access_token"]
+    pro_headers = {"Authorization": f"Bearer {pro_token}"}
+
+    # 3-6. Token refresh, file upload, device token and categories only
+    # need the customer's tokens, so they run concurrently. Under pytest the
+    # categories come from the session fixture and aren't fetched again.
+    print("\n[3-6] Testing Token Refresh, File Upload, Device Token Registration...")
+    files = {"file": ("test_image.png", io.BytesIO(PNG_BYTES), "image/png")}
+    calls = [
+        client.post("/auth/refresh", json={"refresh_token": cust_refresh}),
+        client.post("/uploads/", files=files, headers=cust_headers),
+        client.post("/notifications/device-token",
+                    json={"token": f"fcm_token_{suffix}", "platform": "android"},
+                    headers=cust_headers),
+    ]
+    if categories is None:
+        calls.append(client.get("/services/categories", headers=cust_headers))
+    refresh_resp, upload_resp, token_resp, *cats_resp = await asyncio.gather(*calls)
+    if categories is None:
+        categories = cats_resp[0].json()
+
+    assert refresh_resp.status_code == 200, f"Refresh failed: {refresh_resp.text}"
+    assert refresh_resp.json()["access_token"], "Refresh returned no access token"
+    print("    Token refreshed successfully.")
+
+    if upload_resp.status_code == 200:
+        print(f"    Upload success: {upload_resp.json()['url']}")
+    else:
+        print(f"    Upload failed: {upload_resp.text} (Proceeding, maybe dir issue)")
+
+    assert token_resp.status_code == 200, f"Token reg failed: {token_resp.text}"
+    print("    Device token registered.")
+
+    # 7. Create Service Request (New API)
+    print("\n[7] Creating Service Request...")
+    cat_id = categories[0]['id'] if categories else "general"
+    req_payload = {**REQUEST_BASE, "category_id": cat_id}
+
+    # 8. Create Chat Room
+    # Pro initiates chat ? No, customer initiates usually, or pro starts from open request?
+    # Let's say customer starts chat with a pro they found. 
+    # For test, we need pro ID. 
+    # Let's use `POST /bookings/` legacy flow to just get a booking quickly to test tracking?
+    # Or better, let's just create a Booking directly via legacy endpoint which is easier for now.
+    print("\n[8] Creating Legacy Booking for Tracking Test...")
+    booking_payload = {**BOOKING_BASE, "service_id": cat_id}
+    resp, booking_resp = await asyncio.gather(
+        client.post("/requests/", json=req_payload, headers=cust_headers),
+        client.post("/bookings/", json=booking_payload, headers=cust_headers),
+    )
+    assert resp.status_code == 200, f"Request failed: {resp.text}"
+    req_id = resp.json()['id']
+    print(f"    Request created: {req_id}")
+    booking_id = booking_resp.json()['id']
+    print(f"    Booking created: {booking_id}")
+    
+    # Pro accepts
+    await client.post(f"/bookings/{booking_id}/accept", headers=pro_headers)
+    print("    Pro accepted booking.")
+
+    # 9. Map Tracking
+    print("\n[9] Testing Map Tracking...")
+    # Pro updates location
+    lat, lng = 28.6139, 77.2090 # New Delhi
+    resp = await client.put("/pro/location", json={"latitude": lat, "longitude": lng}, headers=pro_headers)
+    assert resp.status_code == 200, f"Location update failed: {resp.text}"
+    print("    Pro location updated.")
+    
+    # Cust fetches location
+    resp = await client.get(f"/bookings/{booking_id}/location", headers=cust_headers)
+    assert resp.status_code == 200, f"Get location failed: {resp.text}"
+    loc_data = resp.json()
+    print(f"    Customer fetched location: {loc_data}")
+    assert loc_data['latitude'] == lat, "Latitude mismatch"
+    assert loc_data['longitude'] == lng, "Longitude mismatch"
+    print("    Map tracking verified!")
+
+    print("\n✅ Integration Test Completed Successfully!")
+
+
+def test_integration_flow(client, categories, run):
+    run(run_test(client, categories))
+
+
+async def main():
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10.0, transport=make_transport()) as client:
+        await run_test(client)
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        print(f"\n❌ Test Failed: {e}")
+        exit(1)
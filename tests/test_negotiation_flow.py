@@ -5,300 +5,420 @@ Tests the full negotiation flow:
   Get matches → Create chat → Negotiate price → Accept price → Booking created →
   Complete booking → Review
 """
+import argparse
+import asyncio
+import csv
 import httpx
-import uuid
+import orjson
+import random
+import statistics
+import time
 import sys
 
-BASE_URL = "http://127.0.0.1:8000/api/v1"
-suffix = str(uuid.uuid4())[:8]
-
-
-def test_full_flow():
-    print(f"\n{'='*60}")
-    print(f"  SkillnScale Full Negotiation Flow Test")
-    print(f"{'='*60}\n")
-
-    with httpx.Client(base_url=BASE_URL, timeout=15.0) as client:
-
-        # ─── 1. Health Check ─────────────────────────────────
-        print("1. Health check...")
-        resp = client.get("/health")
-        assert resp.status_code == 200, f"Health check failed: {resp.text}"
-        print("   ✅ Server is healthy\n")
-
-        # ─── 2. Get Categories ───────────────────────────────
-        print("2. Fetching service categories...")
-        resp = client.get("/services/categories")
-        assert resp.status_code == 200
-        categories = resp.json()
-        assert len(categories) == 8, f"Expected 8 categories, got {len(categories)}"
-        cat_names = [c['name'] for c in categories]
-        print(f"   ✅ Found {len(categories)} categories: {cat_names}\n")
-
-        # ─── 3. Customer Signup ──────────────────────────────
-        customer_email = f"customer_{suffix}@test.com"
-        print(f"3. Customer signup: {customer_email}")
-        resp = client.post("/auth/signup", json={
-            "email": customer_email,
-            "password": "password123",
-            "full_name": "Rajat Customer",
-            "role": "customer",
-            "phone": "9876543210",
-        })
-        assert resp.status_code == 200, f"Signup failed: {resp.text}"
-        customer = resp.json()
-        print(f"   ✅ Customer created: ID {customer['id'][:8]}...\n")
-
-        # ─── 4. Customer Login ───────────────────────────────
-        print("4. Customer login...")
-        resp = client.post("/auth/login/json", json={
-            "email": customer_email,
-            "password": "password123",
-        })
-        assert resp.status_code == 200, f"Login failed: {resp.text}"
-        cust_token = resp.json()["access_token"]
-        cust_headers = {"Authorization": f"Bearer {cust_token}"}
-        print("   ✅ Customer logged in\n")
-
-        # ─── 5. Get /users/me ────────────────────────────────
-        print("5. Get customer profile...")
-        resp = client.get("/users/me", headers=cust_headers)
-        assert resp.status_code == 200
-        me = resp.json()
-        assert me["email"] == customer_email
-        print(f"   ✅ Profile: {me['full_name']} ({me['role']})\n")
-
-        # ─── 6. Create Service Request ───────────────────────
-        print("6. Customer creates service request...")
-        resp = client.post("/requests/", json={
-            "category_id": "plumbing",
-            "title": "Kitchen Sink Leak",
-            "description": "Kitchen sink is leaking badly. Water dripping from the pipe under the sink. Need urgent repair.",
-            "location": "Jaipur, Rajasthan",
-            "urgency": "immediate",
-        }, headers=cust_headers)
-        assert resp.status_code == 200, f"Create request failed: {resp.text}"
-        service_req = resp.json()
-        request_id = service_req["id"]
-        print(f"   ✅ Request created: {service_req['title']} (ID: {request_id[:8]}...)\n")
-
-        # ─── 7. Professional Signup ──────────────────────────
-        pro_email = f"plumber_{suffix}@test.com"
-        print(f"7. Professional signup: {pro_email}")
-        resp = client.post("/auth/signup", json={
-            "email": pro_email,
-            "password": "password123",
-            "full_name": "Ramesh Plumber",
-            "role": "pro",
-            "phone": "9876543211",
-            "service_category": "plumbing",
-        })
-        assert resp.status_code == 200, f"Pro signup failed: {resp.text}"
-        pro = resp.json()
-        pro_id = pro["id"]
-        print(f"   ✅ Professional created: {pro['full_name']} (ID: {pro_id[:8]}...)\n")
-
-        # ─── 8. Professional Login ───────────────────────────
-        print("8. Professional login...")
-        resp = client.post("/auth/login/json", json={
-            "email": pro_email,
-            "password": "password123",
-        })
-        assert resp.status_code == 200
-        pro_token = resp.json()["access_token"]
-        pro_headers = {"Authorization": f"Bearer {pro_token}"}
-        print("   ✅ Professional logged in\n")
-
-        # ─── 9. Set Availability ─────────────────────────────
-        print("9. Professional sets availability...")
-        resp = client.post("/availability/", json={
-            "date": "2026-02-14",
-            "start_time": "14:00",
-            "end_time": "17:00",
-            "is_recurring": False,
-        }, headers=pro_headers)
-        assert resp.status_code == 200, f"Set availability failed: {resp.text}"
-        slot = resp.json()
-        print(f"   ✅ Slot created: {slot['date']} {slot['start_time']}-{slot['end_time']}\n")
-
-        # ─── 10. Get Matched Professionals ───────────────────
-        print("10. Customer gets matched professionals...")
-        resp = client.get(f"/requests/{request_id}/matches", headers=cust_headers)
-        assert resp.status_code == 200, f"Matches failed: {resp.text}"
-        matches = resp.json()
-        assert len(matches) >= 1, "No matches found!"
-        print(f"   ✅ Found {len(matches)} match(es): {[m['full_name'] for m in matches]}\n")
-
-        matched_pro_id = matches[0]["id"]
-
-        # ─── 11. Create Chat Room ────────────────────────────
-        print("11. Customer starts chat with professional...")
-        resp = client.post("/chat/rooms/", json={
-            "request_id": request_id,
-            "professional_id": matched_pro_id,
-        }, headers=cust_headers)
-        assert resp.status_code == 200, f"Create chat failed: {resp.text}"
-        room = resp.json()
-        room_id = room["id"]
-        print(f"   ✅ Chat room created: {room_id[:8]}...\n")
-
-        # ─── 12. Exchange Messages ───────────────────────────
-        print("12. Chat conversation...")
-
-        # Customer message
-        resp = client.post(f"/chat/rooms/{room_id}/messages", json={
-            "content": "Hi, my sink is leaking. Can you come today?",
-            "message_type": "text",
-        }, headers=cust_headers)
-        assert resp.status_code == 200
-        print("   📨 Customer: Hi, my sink is leaking. Can you come today?")
-
-        # Pro message
-        resp = client.post(f"/chat/rooms/{room_id}/messages", json={
-            "content": "Yes, I can come between 2-5 PM. What kind of pipe is it?",
-            "message_type": "text",
-        }, headers=pro_headers)
-        assert resp.status_code == 200
-        print("   📨 Pro: Yes, I can come between 2-5 PM. What kind of pipe is it?")
-
-        # Customer message
-        resp = client.post(f"/chat/rooms/{room_id}/messages", json={
-            "content": "It's a PVC pipe under the kitchen sink. How much would it cost?",
-            "message_type": "text",
-        }, headers=cust_headers)
-        assert resp.status_code == 200
-        print("   📨 Customer: It's a PVC pipe. How much would it cost?")
-
-        # Pro proposes price
-        resp = client.post(f"/chat/rooms/{room_id}/messages", json={
-            "content": "For PVC pipe repair, I can do it for ₹400",
-            "message_type": "price_proposal",
-            "proposed_price": 400.0,
-        }, headers=pro_headers)
-        assert resp.status_code == 200
-        print("   💰 Pro proposes: ₹400")
-
-        # Customer counter-proposes
-        resp = client.post(f"/chat/rooms/{room_id}/messages", json={
-            "content": "Can you do it for ₹300?",
-            "message_type": "price_proposal",
-            "proposed_price": 300.0,
-        }, headers=cust_headers)
-        assert resp.status_code == 200
-        print("   💰 Customer counter: ₹300")
-
-        # Pro counters
-        resp = client.post(f"/chat/rooms/{room_id}/messages", json={
-            "content": "Final offer: ₹350 including pipe replacement",
-            "message_type": "price_proposal",
-            "proposed_price": 350.0,
-        }, headers=pro_headers)
-        assert resp.status_code == 200
-        print("   💰 Pro final: ₹350")
-
-        # Verify messages stored
-        resp = client.get(f"/chat/rooms/{room_id}/messages", headers=cust_headers)
-        assert resp.status_code == 200
-        messages = resp.json()
-        print(f"   ✅ {len(messages)} messages in chat\n")
-
-        # ─── 13. Accept Price → Booking Created ─────────────
-        print("13. Customer accepts ₹350...")
-        resp = client.post(f"/chat/rooms/{room_id}/accept-price", headers=cust_headers)
-        assert resp.status_code == 200, f"Accept price failed: {resp.text}"
-        booking = resp.json()
-        booking_id = booking["id"]
-        assert booking["agreed_price"] == 350.0
-        assert booking["status"] == "confirmed"
-        print(f"   ✅ Booking created! ID: {booking_id[:8]}... Price: ₹{booking['agreed_price']}\n")
-
-        # ─── 14. Update Booking Status ───────────────────────
-        print("14. Professional starts job...")
-        resp = client.patch(f"/bookings/{booking_id}/status", json={
-            "status": "in_progress",
-        }, headers=pro_headers)
-        assert resp.status_code == 200
-        print("   ✅ Status: in_progress")
-
-        print("    Professional completes job...")
-        resp = client.patch(f"/bookings/{booking_id}/status", json={
-            "status": "completed",
-        }, headers=pro_headers)
-        assert resp.status_code == 200
-        updated = resp.json()
-        assert updated["status"] == "completed"
-        print("   ✅ Status: completed\n")
-
-        # ─── 15. Submit Review ───────────────────────────────
-        print("15. Customer submits review...")
-        resp = client.post("/reviews/", json={
-            "booking_id": booking_id,
-            "rating": 5,
-            "comment": "Excellent work! Fixed the leak quickly and cleanly. Very professional.",
-        }, headers=cust_headers)
-        assert resp.status_code == 200, f"Review failed: {resp.text}"
-        review = resp.json()
-        print(f"   ✅ Review submitted: {review['rating']}/5 stars\n")
-
-        # ─── 16. Verify Pro Rating ───────────────────────────
-        print("16. Verify professional profile with rating...")
-        resp = client.get(f"/users/{pro_id}", headers=cust_headers)
-        assert resp.status_code == 200
-        pro_profile = resp.json()
-        assert pro_profile["rating"] == 5.0
-        assert pro_profile["jobs_completed"] == 1
-        print(f"   ✅ {pro_profile['full_name']}: ⭐ {pro_profile['rating']}/5, {pro_profile['jobs_completed']} job(s) completed\n")
-
-        # ─── 17. List Chat Rooms ─────────────────────────────
-        print("17. List customer's chat rooms...")
-        resp = client.get("/chat/rooms/", headers=cust_headers)
+from http_client import BASE_URL, make_suffix, make_transport
+
+SUFFIX = make_suffix()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# ─── Fixed payloads (only emails and ids vary per run) ───
+PASSWORD = "password123"
+CUSTOMER_SIGNUP = {"password": PASSWORD, "full_name": "Rajat Customer", "role": "customer"}
+PRO_SIGNUP = {"password": PASSWORD, "full_name": "Ramesh Plumber", "role": "pro", "service_category": "plumbing"}
+SERVICE_REQUEST = {
+    "category_id": "plumbing",
+    "title": "Kitchen Sink Leak",
+    "description": "Kitchen sink is leaking badly. Water dripping from the pipe under the sink. Need urgent repair.",
+    "location": "Jaipur, Rajasthan",
+    "urgency": "immediate",
+}
+AVAILABILITY_SLOT = {"date": "2026-02-14", "start_time": "14:00", "end_time": "17:00", "is_recurring": False}
+CUSTOMER_TEXTS = (
+    {"content": "Hi, my sink is leaking. Can you come today?", "message_type": "text"},
+    {"content": "It's a PVC pipe under the kitchen sink. How much would it cost?", "message_type": "text"},
+)
+PRO_TEXTS = (
+    {"content": "Yes, I can come between 2-5 PM. What kind of pipe is it?", "message_type": "text"},
+)
+# (sender, payload, log line) in the order they must be stored
+PRICE_PROPOSALS = (
+    ("pro", {"content": "For PVC pipe repair, I can do it for ₹400", "message_type": "price_proposal", "proposed_price": 400.0},
+     "💰 Pro proposes: ₹400"),
+    ("customer", {"content": "Can you do it for ₹300?", "message_type": "price_proposal", "proposed_price": 300.0},
+     "💰 Customer counter: ₹300"),
+    ("pro", {"content": "Final offer: ₹350 including pipe replacement", "message_type": "price_proposal", "proposed_price": 350.0},
+     "💰 Pro final: ₹350"),
+)
+STATUS_IN_PROGRESS = {"status": "in_progress"}
+STATUS_COMPLETED = {"status": "completed"}
+REVIEW = {"rating": 5, "comment": "Excellent work! Fixed the leak quickly and cleanly. Very professional."}
+INVALID_LOGIN = {"email": "wrong@test.com", "password": "wrongpassword"}
+DUPLICATE_SIGNUP = {"password": PASSWORD, "full_name": "Duplicate User", "role": "customer"}
+
+
+def _quiet(*args, **kwargs):
+    pass
+
+
+def random_phone():
+    return f"9{random.randint(100000000, 999999999)}"
+
+
+def jsend(client: httpx.AsyncClient, method: str, path: str, payload, headers=None):
+    """Send ``payload`` as an orjson-encoded JSON body."""
+    return client.request(
+        method, path,
+        content=orjson.dumps(payload),
+        headers={**JSON_HEADERS, **headers} if headers else JSON_HEADERS,
+    )
+
+
+async def fire(client: httpx.AsyncClient, method: str, path: str, payload, headers=None) -> int:
+    """Like jsend, for calls whose response body is never looked at; returns the status code.
+
+    The body is drained raw (no decoding or buffering) rather than left unread:
+    closing an unread response makes httpcore drop the keep-alive connection.
+    """
+    async with client.stream(
+        method, path,
+        content=orjson.dumps(payload),
+        headers={**JSON_HEADERS, **headers} if headers else JSON_HEADERS,
+    ) as resp:
+        async for _ in resp.aiter_raw():
+            pass
+        return resp.status_code
+
+
+async def run_full_flow(client: httpx.AsyncClient, categories=None, suffix=None, verbose=True):
+    """Run one full negotiation flow; returns per-step wall times in ms."""
+    suffix = suffix or SUFFIX
+    log = print if verbose else _quiet
+    timings = {}
+    last = time.perf_counter()
+
+    def lap(step):
+        nonlocal last
+        now = time.perf_counter()
+        timings[step] = (now - last) * 1000
+        last = now
+
+    log(f"\n{'='*60}")
+    log(f"  SkillnScale Full Negotiation Flow Test")
+    log(f"{'='*60}\n")
+
+    # ─── 1. Health Check ─────────────────────────────────
+    log("1. Health check...")
+    resp = await client.get("/health")
+    assert resp.status_code == 200, f"Health check failed: {resp.text}"
+    log("   ✅ Server is healthy\n")
+
+    lap("health_check")
+
+    # ─── 2. Get Categories ───────────────────────────────
+    log("2. Fetching service categories...")
+    if categories is None:
+        resp = await client.get("/services/categories")
         assert resp.status_code == 200
-        rooms = resp.json()
-        assert len(rooms) >= 1
-        print(f"   ✅ Found {len(rooms)} chat room(s)\n")
-
-        # ─── 18. Invalid Login Test ──────────────────────────
-        print("18. Negative test: invalid login...")
-        resp = client.post("/auth/login/json", json={
-            "email": "wrong@test.com",
-            "password": "wrongpassword",
-        })
-        assert resp.status_code == 400
-        print("   ✅ Invalid login correctly rejected\n")
-
-        # ─── 19. Duplicate Signup Test ───────────────────────
-        print("19. Negative test: duplicate signup...")
-        resp = client.post("/auth/signup", json={
-            "email": customer_email,
-            "password": "password123",
-            "full_name": "Duplicate User",
-            "role": "customer",
-        })
-        assert resp.status_code == 400
-        print("   ✅ Duplicate signup correctly rejected\n")
-
-        # ─── Summary ────────────────────────────────────────
-        print(f"{'='*60}")
-        print(f"  🎉 ALL 19 TESTS PASSED!")
-        print(f"{'='*60}")
-        print(f"\n  Full negotiation flow verified:")
-        print(f"  ✅ Auth (signup, login, /me)")
-        print(f"  ✅ Service categories (8 seeded)")
-        print(f"  ✅ Service request with problem description")
-        print(f"  ✅ Professional availability time slots")
-        print(f"  ✅ Matching (category-based)")
-        print(f"  ✅ Chat rooms + messages")
-        print(f"  ✅ Price negotiation (propose/counter/accept)")
-        print(f"  ✅ Auto-booking on price acceptance")
-        print(f"  ✅ Booking lifecycle (confirmed → in_progress → completed)")
-        print(f"  ✅ Reviews with computed ratings")
-        print(f"  ✅ Error handling (invalid login, duplicate signup)")
-        print()
+        categories = orjson.loads(resp.content)
+    assert len(categories) == 8, f"Expected 8 categories, got {len(categories)}"
+    cat_names = [c['name'] for c in categories]
+    log(f"   ✅ Found {len(categories)} categories: {cat_names}\n")
+
+    lap("get_categories")
+
+    # ─── 3. Customer Signup ──────────────────────────────
+    customer_email = f"customer_{suffix}@test.com"
+    log(f"3. Customer signup: {customer_email}")
+    resp = await jsend(client, "POST", "/auth/signup", {**CUSTOMER_SIGNUP, "email": customer_email, "phone": random_phone()})
+    assert resp.status_code == 200, f"Signup failed: {resp.text}"
+    customer = orjson.loads(resp.content)
+    log(f"   ✅ Customer created: ID {customer['id'][:8]}...\n")
+
+    lap("customer_signup")
+
+    # ─── 4. Customer Login ───────────────────────────────
+    log("4. Customer login...")
+    resp = await jsend(client, "POST", "/auth/login/json", {"email": customer_email, "password": PASSWORD})
+    assert resp.status_code == 200, f"Login failed: {resp.text}"
+    cust_token = orjson.loads(resp.content)["access_token"]
+    cust_headers = {"Authorization": f"Bearer {cust_token}"}
+    log("   ✅ Customer logged in\n")
+
+    lap("customer_login")
+
+    # ─── 5. Get /users/me ────────────────────────────────
+    log("5. Get customer profile...")
+    resp = await client.get("/users/me", headers=cust_headers)
+    assert resp.status_code == 200
+    me = orjson.loads(resp.content)
+    assert me["email"] == customer_email
+    log(f"   ✅ Profile: {me['full_name']} ({me['role']})\n")
+
+    lap("get_users_me")
+
+    # ─── 6. Create Service Request ───────────────────────
+    log("6. Customer creates service request...")
+    resp = await jsend(client, "POST", "/requests/", SERVICE_REQUEST, headers=cust_headers)
+    assert resp.status_code == 200, f"Create request failed: {resp.text}"
+    service_req = orjson.loads(resp.content)
+    request_id = service_req["id"]
+    log(f"   ✅ Request created: {service_req['title']} (ID: {request_id[:8]}...)\n")
+
+    lap("create_service_request")
+
+    # ─── 7. Professional Signup ──────────────────────────
+    pro_email = f"plumber_{suffix}@test.com"
+    log(f"7. Professional signup: {pro_email}")
+    resp = await jsend(client, "POST", "/auth/signup", {**PRO_SIGNUP, "email": pro_email, "phone": random_phone()})
+    assert resp.status_code == 200, f"Pro signup failed: {resp.text}"
+    pro = orjson.loads(resp.content)
+    pro_id = pro["id"]
+    log(f"   ✅ Professional created: {pro['full_name']} (ID: {pro_id[:8]}...)\n")
+
+    lap("professional_signup")
+
+    # ─── 8. Professional Login ───────────────────────────
+    log("8. Professional login...")
+    resp = await jsend(client, "POST", "/auth/login/json", {"email": pro_email, "password": PASSWORD})
+    assert resp.status_code == 200
+    pro_token = orjson.loads(resp.content)["access_token"]
+    pro_headers = {"Authorization": f"Bearer {pro_token}"}
+    log("   ✅ Professional logged in\n")
+
+    lap("professional_login")
+
+    # ─── 9. Set Availability ─────────────────────────────
+    log("9. Professional sets availability...")
+    resp = await jsend(client, "POST", "/availability/", AVAILABILITY_SLOT, headers=pro_headers)
+    assert resp.status_code == 200, f"Set availability failed: {resp.text}"
+    slot = orjson.loads(resp.content)
+    log(f"   ✅ Slot created: {slot['date']} {slot['start_time']}-{slot['end_time']}\n")
+
+    lap("set_availability")
+
+    # ─── 10. Get Matched Professionals ───────────────────
+    log("10. Customer gets matched professionals...")
+    resp = await client.get(f"/requests/{request_id}/matches", headers=cust_headers)
+    assert resp.status_code == 200, f"Matches failed: {resp.text}"
+    matches = orjson.loads(resp.content)
+    assert len(matches) >= 1, "No matches found!"
+    log(f"   ✅ Found {len(matches)} match(es): {[m['full_name'] for m in matches]}\n")
+
+    # Prefer this flow's own pro: with several flows running, other pros match too
+    matched_pro_id = pro_id if any(m["id"] == pro_id for m in matches) else matches[0]["id"]
+
+    lap("get_matched_professionals")
+
+    # ─── 11. Create Chat Room ────────────────────────────
+    log("11. Customer starts chat with professional...")
+    resp = await jsend(client, "POST", "/chat/rooms/", {
+        "request_id": request_id,
+        "professional_id": matched_pro_id,
+    }, headers=cust_headers)
+    assert resp.status_code == 200, f"Create chat failed: {resp.text}"
+    room = orjson.loads(resp.content)
+    room_id = room["id"]
+    log(f"   ✅ Chat room created: {room_id[:8]}...\n")
+
+    lap("create_chat_room")
+
+    # ─── 12. Exchange Messages ───────────────────────────
+    log("12. Chat conversation...")
+
+    # Plain text messages: order is only kept per sender, so the customer
+    # and pro chains run concurrently
+    async def send_texts(headers, label, messages):
+        for message in messages:
+            status = await fire(client, "POST", f"/chat/rooms/{room_id}/messages", message, headers=headers)
+            assert status == 200
+            log(f"   📨 {label}: {message['content']}")
+
+    await asyncio.gather(
+        send_texts(cust_headers, "Customer", CUSTOMER_TEXTS),
+        send_texts(pro_headers, "Pro", PRO_TEXTS),
+    )
+
+    # Price proposals stay serial: accept-price takes the latest one,
+    # which must be the pro's final offer
+    sender_headers = {"customer": cust_headers, "pro": pro_headers}
+    for sender, message, log_line in PRICE_PROPOSALS:
+        status = await fire(client, "POST", f"/chat/rooms/{room_id}/messages", message, headers=sender_headers[sender])
+        assert status == 200
+        log(f"   {log_line}")
+
+    # Verify messages stored — the POSTs above only check status; the
+    # stored conversation is decoded and checked once, here
+    resp = await client.get(f"/chat/rooms/{room_id}/messages", headers=cust_headers)
+    assert resp.status_code == 200
+    messages = orjson.loads(resp.content)
+    # create_chat_room adds a "Chat started for: ..." system message first
+    sent = sum(1 for m in messages if m["message_type"] != "system")
+    assert sent == 6, f"Expected 6 sent messages, got {sent}"
+    text_count = sum(1 for m in messages if m["message_type"] == "text")
+    assert text_count == 3, f"Expected 3 text messages, got {text_count}"
+    prices = [m["proposed_price"] for m in messages if m["message_type"] == "price_proposal"]
+    assert prices == [400.0, 300.0, 350.0], f"Unexpected proposals: {prices}"
+    log(f"   ✅ {len(messages)} messages in chat\n")
+
+    lap("exchange_messages")
+
+    # ─── 13. Accept Price → Booking Created ─────────────
+    log("13. Customer accepts ₹350...")
+    resp = await client.post(f"/chat/rooms/{room_id}/accept-price", headers=cust_headers)
+    assert resp.status_code == 200, f"Accept price failed: {resp.text}"
+    booking = orjson.loads(resp.content)
+    booking_id = booking["id"]
+    assert booking["agreed_price"] == 350.0
+    assert booking["status"] == "confirmed"
+    log(f"   ✅ Booking created! ID: {booking_id[:8]}... Price: ₹{booking['agreed_price']}\n")
+
+    lap("accept_price")
+
+    # ─── 14. Update Booking Status ───────────────────────
+    log("14. Professional starts job...")
+    status = await fire(client, "PATCH", f"/bookings/{booking_id}/status", STATUS_IN_PROGRESS, headers=pro_headers)
+    assert status == 200
+    log("   ✅ Status: in_progress")
+
+    log("    Professional completes job...")
+    resp = await jsend(client, "PATCH", f"/bookings/{booking_id}/status", STATUS_COMPLETED, headers=pro_headers)
+    assert resp.status_code == 200
+    updated = orjson.loads(resp.content)
+    assert updated["status"] == "completed"
+    log("   ✅ Status: completed\n")
+
+    lap("update_booking_status")
+
+    # ─── 15. Submit Review ───────────────────────────────
+    log("15. Customer submits review...")
+    resp = await jsend(client, "POST", "/reviews/", {**REVIEW, "booking_id": booking_id}, headers=cust_headers)
+    assert resp.status_code == 200, f"Review failed: {resp.text}"
+    review = orjson.loads(resp.content)
+    log(f"   ✅ Review submitted: {review['rating']}/5 stars\n")
+
+    lap("submit_review")
+
+    # ─── 16. Verify Pro Rating ───────────────────────────
+    log("16. Verify professional profile with rating...")
+    resp = await client.get(f"/users/{pro_id}", headers=cust_headers)
+    assert resp.status_code == 200
+    pro_profile = orjson.loads(resp.content)
+    assert pro_profile["rating"] == 5.0
+    assert pro_profile["jobs_completed"] == 1
+    log(f"   ✅ {pro_profile['full_name']}: ⭐ {pro_profile['rating']}/5, {pro_profile['jobs_completed']} job(s) completed\n")
+
+    lap("verify_pro_rating")
+
+    # ─── 17. List Chat Rooms ─────────────────────────────
+    log("17. List customer's chat rooms...")
+    resp = await client.get("/chat/rooms/", headers=cust_headers)
+    assert resp.status_code == 200
+    rooms = orjson.loads(resp.content)
+    assert len(rooms) >= 1
+    log(f"   ✅ Found {len(rooms)} chat room(s)\n")
+
+    lap("list_chat_rooms")
+
+    # ─── 18. Invalid Login Test ──────────────────────────
+    log("18. Negative test: invalid login...")
+    status = await fire(client, "POST", "/auth/login/json", INVALID_LOGIN)
+    assert status == 400
+    log("   ✅ Invalid login correctly rejected\n")
+
+    lap("invalid_login_test")
+
+    # ─── 19. Duplicate Signup Test ───────────────────────
+    log("19. Negative test: duplicate signup...")
+    status = await fire(client, "POST", "/auth/signup", {**DUPLICATE_SIGNUP, "email": customer_email})
+    assert status == 400
+    log("   ✅ Duplicate signup correctly rejected\n")
+
+    lap("duplicate_signup_test")
+
+    # ─── Summary ────────────────────────────────────────
+    log(f"{'='*60}")
+    log(f"  🎉 ALL 19 TESTS PASSED!")
+    log(f"{'='*60}")
+    log(f"\n  Full negotiation flow verified:")
+    log(f"  ✅ Auth (signup, login, /me)")
+    log(f"  ✅ Service categories (8 seeded)")
+    log(f"  ✅ Service request with problem description")
+    log(f"  ✅ Professional availability time slots")
+    log(f"  ✅ Matching (category-based)")
+    log(f"  ✅ Chat rooms + messages")
+    log(f"  ✅ Price negotiation (propose/counter/accept)")
+    log(f"  ✅ Auto-booking on price acceptance")
+    log(f"  ✅ Booking lifecycle (confirmed → in_progress → completed)")
+    log(f"  ✅ Reviews with computed ratings")
+    log(f"  ✅ Error handling (invalid login, duplicate signup)")
+    log()
+    return timings
+
+
+def test_full_flow(client, categories, run):
+    run(run_full_flow(client, categories))
+
+
+async def run_concurrent(flows: int, csv_path=None):
+    """Run ``flows`` independent negotiation flows at once and report per-step latency."""
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=15.0, transport=make_transport()) as client:
+        resp = await client.get("/services/categories")
+        assert resp.status_code == 200, f"Categories failed: {resp.text}"
+        categories = orjson.loads(resp.content)
+        results = await asyncio.gather(*[
+            run_full_flow(client, categories, suffix=f"{SUFFIX}_{i}", verbose=False)
+            for i in range(flows)
+        ], return_exceptions=True)
+
+    timings = [r for r in results if isinstance(r, dict)]
+    failures = [r for r in results if not isinstance(r, dict)]
+    print(f"\n{len(timings)}/{flows} flows passed")
+    for exc in failures[:5]:
+        print(f"   ❌ {type(exc).__name__}: {exc}")
+
+    if timings:
+        print(f"\n  {'step':<28}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+        steps = list(timings[0]) + ["total"]
+        for t in timings:
+            t["total"] = sum(t.values())
+        for step in steps:
+            values = [t[step] for t in timings]
+            if len(values) > 1:
+                cuts = statistics.quantiles(values, n=20)
+                p50, p95 = cuts[9], cuts[18]
+            else:
+                p50 = p95 = values[0]
+            print(f"  {step:<28}{p50:>10.1f}{p95:>10.1f}{max(values):>10.1f}")
+
+    if csv_path and timings:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["flow", "step", "ms"])
+            for i, t in enumerate(timings):
+                for step, ms in t.items():
+                    writer.writerow([i, step, f"{ms:.3f}"])
+        print(f"\n  Wrote {csv_path}")
+
+    if failures:
+        raise failures[0]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="SkillnScale negotiation flow test / load driver")
+    parser.add_argument("-k", "--flows", type=int, default=1, help="number of concurrent flows (default: 1)")
+    parser.add_argument("--csv", help="write per-flow step timings (ms) to this CSV file")
+    args = parser.parse_args()
+
+    if args.flows > 1 or args.csv:
+        await run_concurrent(args.flows, args.csv)
+        return
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=15.0, transport=make_transport()) as client:
+        await run_full_flow(client)
 
 
 if __name__ == "__main__":
     try:
-        test_full_flow()
+        asyncio.run(main())
     except AssertionError as e:
         print(f"\n   ❌ TEST FAILED: {e}")
         sys.exit(1)